@@ -320,8 +320,8 @@ class CompleteComposer:
         extended_melody_rhythm = []
         
         for rep in range(repetitions_needed):
-            current_notes = base_melody_notes.copy()
-            current_rhythm = base_melody_rhythm.copy()
+            current_notes = list(base_melody_notes)
+            current_rhythm = list(base_melody_rhythm)
             
             # Apply variations every few repetitions to avoid monotony
             if rep % 4 == 1:  # Transpose up
@@ -442,8 +442,6 @@ class CompleteComposer:
         self, song_structure: SongStructure, melodic_variations: Dict[str, Melody]
     ) -> List[Dict[str, Any]]:
         """Create detailed section data."""
-        from ..constants import get_default_melody_notes, get_default_rhythm_pattern
-
         sections = []
         verse_count = 0
         chorus_count = 0
@@ -470,12 +468,7 @@ class CompleteComposer:
                     "measures": section.measures,
                     "key": section.key,
                     "melody": (
-                        {
-                            "notes": section_melody.notes if section_melody else get_default_melody_notes(),
-                            "rhythm": section_melody.rhythm if section_melody else get_default_rhythm_pattern(),
-                        }
-                        if section_melody
-                        else None
+                        {"notes": section_melody.notes, "rhythm": section_melody.rhythm} if section_melody else None
                     ),
                     "energy_level": section.energy_level,
                     "characteristics": section.characteristics,
@@ -13,7 +13,11 @@ Contains tool descriptions, parameters, and help information for all available t
 #   (with lots of help from AI agents)
 #
 
-from typing import Dict, List, Any
+import functools
+import re
+import sys
+from types import MappingProxyType
+from typing import Dict, List, Any, Tuple
 
 # Import all music theory constants
 from .theory.constants import (
@@ -622,15 +626,84 @@ TOOL_DEFINITIONS = {
     },
 }
 
+# Freeze the tool tables: read-only mappings with interned names, parameters and examples as immutable types
+TOOL_CATEGORIES = MappingProxyType({sys.intern(key): name for key, name in TOOL_CATEGORIES.items()})
+TOOL_DEFINITIONS = MappingProxyType({
+    sys.intern(tool_name): MappingProxyType({
+        **tool_info,
+        "category": sys.intern(tool_info["category"]),
+        "parameters": MappingProxyType({sys.intern(p): desc for p, desc in tool_info["parameters"].items()}),
+        "examples": tuple(tool_info["examples"]),
+    })
+    for tool_name, tool_info in TOOL_DEFINITIONS.items()
+})
+
+# Seconds a server_status response is reused before the counters are re-read
+SERVER_STATUS_CACHE_TTL = 0.25
+
 # Tool help information organized by category
-TOOL_HELP_BY_CATEGORY = {
-    category: {
+TOOL_HELP_BY_CATEGORY = MappingProxyType({
+    category: MappingProxyType({
         tool_name: tool_info 
         for tool_name, tool_info in TOOL_DEFINITIONS.items() 
         if tool_info["category"] == category
-    }
+    })
     for category in TOOL_CATEGORIES.keys()
-}
+})
+
+def _render_tool_help(tool_name: str) -> str:
+    """Render the detailed help text for one tool."""
+    tool_info = TOOL_DEFINITIONS[tool_name]
+    parts = [
+        f"# {tool_name}\n\n",
+        f"**Category**: {TOOL_CATEGORIES.get(tool_info['category'], 'Unknown')}\n\n",
+        f"**Description**: {tool_info['description']}\n\n",
+    ]
+    if tool_info.get("parameters"):
+        parts.append("**Parameters**:\n")
+        parts.extend(f"- `{param}`: {desc}\n" for param, desc in tool_info["parameters"].items())
+        parts.append("\n")
+    parts.append(f"**Returns**: {tool_info['returns']}\n\n")
+    if tool_info.get("examples"):
+        parts.append("**Examples**:\n")
+        parts.extend(f"```\n{example}\n```\n" for example in tool_info["examples"])
+    return "".join(parts)
+
+def _render_category_help(category: str) -> str:
+    """Render the tool summary for one category."""
+    parts = [f"# {TOOL_CATEGORIES.get(category, category.title())} Tools\n\n"]
+    for tool_name, tool_info in TOOL_HELP_BY_CATEGORY[category].items():
+        parts.append(f"## {tool_name}\n{tool_info['description']}\n")
+        if tool_info.get("parameters"):
+            param_count = len(tool_info["parameters"])
+            parts.append(f"*{param_count} parameter{'s' if param_count != 1 else ''}*\n")
+        parts.append("\n")
+    return "".join(parts)
+
+def _render_help_overview() -> str:
+    """Render the overview of all tools and categories."""
+    parts = ["# MIDI MCP Server - Available Tools\n\n"]
+    for cat_key, cat_name in TOOL_CATEGORIES.items():
+        parts.append(f"## {cat_name}\n")
+        for tool_name, tool_info in TOOL_HELP_BY_CATEGORY.get(cat_key, {}).items():
+            parts.append(f"- **{tool_name}**: {tool_info['description']}\n")
+        parts.append("\n")
+    parts.append(
+        "## Usage\n"
+        "- `help('tool_name')` - Get detailed help for a specific tool\n"
+        "- `help(category='category_name')` - Get help for tools in a category\n"
+        "- `help()` - Show this overview\n\n"
+        "## Available Categories\n"
+    )
+    parts.extend(f"- `{cat_key}`: {cat_name}\n" for cat_key, cat_name in TOOL_CATEGORIES.items())
+    return "".join(parts)
+
+# Help text rendered once at import: None -> overview, ("tool", name), ("category", key)
+RENDERED_HELP = MappingProxyType({
+    None: _render_help_overview(),
+    **{("tool", tool_name): _render_tool_help(tool_name) for tool_name in TOOL_DEFINITIONS},
+    **{("category", category): _render_category_help(category) for category in TOOL_HELP_BY_CATEGORY},
+})
 
 # Quick reference for tool parameter validation
 REQUIRED_PARAMETERS = {
@@ -788,6 +861,55 @@ SECTION_DYNAMICS = {
     "outro": "pp"
 }
 
+# Genre arrangement dynamic plan (ArrangementEngine.create_dynamic_plan); unlike SECTION_DYNAMICS it matches exact
+# section names only and every other section (intro, solo, outro, ...) plays mezzo-piano
+ARRANGEMENT_SECTION_DYNAMICS = MappingProxyType({"verse": "mp", "chorus": "f", "bridge": "mf"})
+
+# Genre arrangement texture by (genre, instrumentation); any other combination is "medium"
+ARRANGEMENT_TEXTURES = MappingProxyType({
+    ("blues", "minimal"): "sparse",
+    ("blues", "standard"): "medium",
+    ("rock", "standard"): "dense",
+    ("jazz", "standard"): "complex",
+    ("ambient", "standard"): "layered",
+})
+
+# Genre part generation (PartGenerator.generate_instrument_part): each instrument's role in the part
+PART_INSTRUMENT_ROLES = MappingProxyType({
+    "piano": "harmonic_support",
+    "guitar": "harmonic_lead",
+    "bass": "harmonic_foundation",
+    "drums": "rhythmic_foundation",
+    "vocals": "melodic_lead",
+})
+
+# Genre part pattern by (instrument, genre)
+PART_PATTERN_TYPES = MappingProxyType({
+    ("piano", "jazz"): "comping",
+    ("piano", "blues"): "comping",
+    ("piano", "rock"): "chordal",
+    ("piano", "pop"): "chordal",
+    ("bass", "jazz"): "walking",
+})
+
+# Part pattern for an instrument when its genre has no entry in PART_PATTERN_TYPES (others use "standard")
+PART_DEFAULT_PATTERN_TYPES = MappingProxyType({"bass": "root_based"})
+
+# Articulation of generated parts by genre
+GENRE_ARTICULATIONS = MappingProxyType({"jazz": "swing", "rock": "staccato", "blues": "legato"})
+
+# Section type to energy level modifier (added to the genre's base energy)
+SECTION_ENERGY_MODIFIERS = {
+    "intro": -0.2,
+    "verse": -0.1,
+    "chorus": +0.2,
+    "bridge": +0.1,
+    "solo": +0.3,
+    "breakdown": -0.3,
+    "build_up": +0.4,
+    "outro": -0.2,
+}
+
 # Instrument role mappings (moved from arrangement.py)
 INSTRUMENT_ROLES = {
     # Keyboard instruments
@@ -831,15 +953,29 @@ INSTRUMENT_ROLES = {
     "backing_vocals": ["harmony", "texture"]
 }
 
+# One-line genre descriptions for the genre listing; other genres are described from their name
+GENRE_DESCRIPTIONS = MappingProxyType({
+    "blues": "Traditional American blues with 12-bar progressions and blues scales",
+    "rock": "Rock music with electric guitars, strong rhythms, and power chords",
+    "hip_hop": "Urban music with rhythmic speech over strong beats",
+    "jazz": "Sophisticated harmony with improvisation and swing rhythms",
+    "country": "American folk music with storytelling and acoustic instruments",
+    "electronic": "Synthesized music with electronic production techniques",
+    "trance": "Electronic dance music with hypnotic rhythms and build-ups",
+    "pop": "Popular music designed for mass appeal and radio play",
+    "ambient": "Atmospheric music focused on texture and mood",
+    "k_pop": "Korean pop music with polished production and catchy hooks",
+})
+
 # Fallback chord progressions by genre (moved from complete_composer.py)
 GENRE_FALLBACK_PROGRESSIONS = {
-    "pop": ["I", "vi", "IV", "V"],
-    "rock": ["I", "VII", "IV", "I"],
-    "jazz": ["ii", "V", "I", "vi"],
-    "blues": ["I", "I", "I", "I", "IV", "IV", "I", "I", "V", "IV", "I", "V"],
-    "classical": ["I", "V", "vi", "IV"],
-    "folk": ["I", "IV", "V", "I"],
-    "country": ["I", "V", "vi", "V"]
+    "pop": ("I", "vi", "IV", "V"),
+    "rock": ("I", "VII", "IV", "I"),
+    "jazz": ("ii", "V", "I", "vi"),
+    "blues": ("I", "I", "I", "I", "IV", "IV", "I", "I", "V", "IV", "I", "V"),
+    "classical": ("I", "V", "vi", "IV"),
+    "folk": ("I", "IV", "V", "I"),
+    "country": ("I", "V", "vi", "V")
 }
 
 # Title generation stop words (moved from complete_composer.py)
@@ -854,10 +990,29 @@ TITLE_STOP_WORDS = {
 # Standard MIDI note numbers for octave 4
 MIDDLE_C_MIDI = 60
 OCTAVE_SEMITONES = 12
+# Melodic intervals wider than this (a perfect fifth) count as large leaps in voice-leading analysis
+LARGE_LEAP_SEMITONES = 7
+
+# Next natural note name up (B wraps to C), for simple stepwise passing tones
+_NATURAL_NOTE_NAMES = [name for name in NOTE_NAMES if len(name) == 1]
+NEXT_NATURAL_NOTE = MappingProxyType({
+    name: _NATURAL_NOTE_NAMES[(i + 1) % len(_NATURAL_NOTE_NAMES)] for i, name in enumerate(_NATURAL_NOTE_NAMES)
+})
 
 # Default fallback melodies (C-D-E-F pattern)
-DEFAULT_MELODY_NOTES = [60, 62, 64, 65]  # C4-D4-E4-F4
-DEFAULT_RHYTHM_PATTERN = [0.25, 0.25, 0.25, 0.25]  # Quarter notes
+DEFAULT_MELODY_NOTES = (60, 62, 64, 65)  # C4-D4-E4-F4
+DEFAULT_RHYTHM_PATTERN = (0.25, 0.25, 0.25, 0.25)  # Quarter notes
+
+# music21 scale classes for the SCALE_PATTERNS names that get_scale_notes builds; other scales fall back to major
+MUSIC21_SCALE_CLASSES = MappingProxyType(
+    {name: f"{name.title()}Scale" for name in SCALE_PATTERNS if name in ("major", "minor", "dorian", "mixolydian")}
+)
+
+# Krumhansl-Kessler probe-tone profiles for C major and C minor (key detection from pitch-class weights)
+KRUMHANSL_MAJOR_PROFILE = (6.35, 2.23, 3.48, 2.33, 4.38, 4.09, 2.52, 5.19, 2.39, 3.66, 2.29, 2.88)
+KRUMHANSL_MINOR_PROFILE = (6.33, 2.68, 3.52, 5.38, 2.60, 3.53, 2.54, 4.75, 3.98, 2.69, 3.34, 3.17)
+# Key names matching the 24 profile rotations: all major keys from C, then all minor keys
+KEY_PROFILE_NAMES = tuple(f"{name} {mode}" for mode in ("major", "minor") for name in NOTE_NAMES)
 
 # Register ranges for different moods/styles
 REGISTER_RANGES = {
@@ -889,7 +1044,15 @@ MOOD_ADJUSTMENTS = {
     }
 }
 
+# Composition keys and default factories used by normalize_composition_input
+_COMP_KEYS = ("melody", "harmony", "structure", "metadata")
+_COMPOSITION_DEFAULTS = {"melody": dict, "harmony": list, "structure": dict, "metadata": dict}
+
 # API Consistency Helper Functions
+def _get_ci(table: dict, key: str, default: Any) -> Any:
+    """Look up a lower-case keyed table, only lower-casing the key when it is not found as given."""
+    return table[key] if key in table else table.get(key.lower(), default)
+
 def normalize_composition_input(composition):
     """
     Normalize composition input to ensure consistent data structure.
@@ -902,19 +1065,11 @@ def normalize_composition_input(composition):
         Dict with standardized keys: melody, harmony, structure, metadata
     """
     if isinstance(composition, dict):
-        return {
-            "melody": composition.get("melody", {}),
-            "harmony": composition.get("harmony", []), 
-            "structure": composition.get("structure", {}),
-            "metadata": composition.get("metadata", {})
-        }
-    else:  # Composition object
-        return {
-            "melody": getattr(composition, "melody", {}),
-            "harmony": getattr(composition, "harmony", []),
-            "structure": getattr(composition, "structure", {}),
-            "metadata": getattr(composition, "metadata", {})
-        }
+        if composition.keys() >= _COMPOSITION_DEFAULTS.keys():
+            return {k: composition[k] for k in _COMP_KEYS}
+        return {k: composition[k] if k in composition else _COMPOSITION_DEFAULTS[k]() for k in _COMP_KEYS}
+    # Composition object
+    return {k: getattr(composition, k) if hasattr(composition, k) else _COMPOSITION_DEFAULTS[k]() for k in _COMP_KEYS}
 
 def get_dynamic_level_value(dynamic_string: str) -> int:
     """
@@ -926,7 +1081,7 @@ def get_dynamic_level_value(dynamic_string: str) -> int:
     Returns:
         MIDI velocity value (0-127)
     """
-    return DYNAMIC_LEVELS.get(dynamic_string.lower(), 64)  # Default to mf
+    return _get_ci(DYNAMIC_LEVELS, dynamic_string, 64)  # Default to mf
 
 def get_section_dynamic(section_type: str) -> str:
     """
@@ -938,7 +1093,7 @@ def get_section_dynamic(section_type: str) -> str:
     Returns:
         Dynamic level string
     """
-    return SECTION_DYNAMICS.get(section_type.lower(), "mf")
+    return _get_ci(SECTION_DYNAMICS, section_type, "mf")
 
 def validate_ensemble_type(ensemble_type: str) -> bool:
     """
@@ -974,9 +1129,9 @@ def validate_genre(genre: str) -> bool:
     Returns:
         True if genre is supported
     """
-    return genre.lower() in GENRE_FALLBACK_PROGRESSIONS
+    return genre in GENRE_FALLBACK_PROGRESSIONS or genre.lower() in GENRE_FALLBACK_PROGRESSIONS
 
-def get_genre_fallback_progression(genre: str) -> list:
+def get_genre_fallback_progression(genre: str) -> tuple:
     """
     Get fallback chord progression for a genre.
     
@@ -984,20 +1139,37 @@ def get_genre_fallback_progression(genre: str) -> list:
         genre: Musical genre
         
     Returns:
-        List of chord symbols
+        Tuple of chord symbols (shared and immutable; copy with list() to modify)
     """
-    return GENRE_FALLBACK_PROGRESSIONS.get(genre.lower(), ["I", "vi", "IV", "V"])
+    return _get_ci(GENRE_FALLBACK_PROGRESSIONS, genre, GENRE_FALLBACK_PROGRESSIONS["pop"])
+
+# Key strings: tonic with optional accidental, then an optional mode ('m' directly after the tonic, or a
+# space-separated 'major' or 'minor')
+_KEY_RE = re.compile(r'^\s*([A-Ga-g][#b]?)(?:\s*(m)|\s+(major|minor))?\s*$', re.IGNORECASE)
+
+# music21 submodules, bound on first use so importing constants stays cheap
+_m21_note = None
+_m21_harmony = None
+_m21_roman = None
+_m21_key = None
+
+def _load_music21() -> None:
+    """Import the music21 submodules used by the helpers below, once."""
+    global _m21_note, _m21_harmony, _m21_roman, _m21_key
+    if _m21_note is None:
+        from music21 import harmony, key, note, roman
+        _m21_note, _m21_harmony, _m21_roman, _m21_key = note, harmony, roman, key
 
 def note_name_to_midi(note_name: str, octave: int = 4) -> int:
     """Convert note name to MIDI number using music21."""
-    from music21 import note
-    music21_note = note.Note(f"{note_name}{octave}")
+    _load_music21()
+    music21_note = _m21_note.Note(f"{note_name}{octave}")
     return music21_note.pitch.midi
 
 def chord_symbol_to_midi_root(chord_symbol: str, octave: int = 4) -> int:
     """Extract root note from chord symbol and convert to MIDI using music21."""
-    from music21 import harmony
-    chord = harmony.ChordSymbol(chord_symbol)
+    _load_music21()
+    chord = _m21_harmony.ChordSymbol(chord_symbol)
     root_note = chord.root().name
     return note_name_to_midi(root_note, octave)
 
@@ -1016,41 +1188,33 @@ def apply_mood_adjustments(melody_notes: list, mood: str) -> list:
         return melody_notes
     
     adjustments = MOOD_ADJUSTMENTS[mood]
-    adjusted_notes = melody_notes.copy()
     
     # Apply chromatic adjustments if specified
-    if "chromatic_adjust" in adjustments:
-        chromatic_adj = adjustments["chromatic_adjust"]
-        adjusted_notes = [
-            note + chromatic_adj[note % OCTAVE_SEMITONES] 
-            for note in adjusted_notes
-        ]
+    chromatic_adj = adjustments.get("chromatic_adjust")
+    if chromatic_adj:
+        adjusted_notes = [note + chromatic_adj[note % OCTAVE_SEMITONES] for note in melody_notes]
+    else:
+        adjusted_notes = melody_notes.copy()
     
-    # Apply register shifts
-    if "register_shift" in adjustments and "register_threshold" in adjustments:
-        shift = adjustments["register_shift"]
-        threshold = adjustments["register_threshold"]
-        
+    # Apply register shifts; the direction test is loop-invariant, the per-note test is a bool multiply
+    # (a shift without a threshold leaves notes alone)
+    shift = adjustments.get("register_shift", 0)
+    threshold = adjustments.get("register_threshold")
+    if shift and threshold is not None:
         if shift > 0:  # Shift higher
-            adjusted_notes = [
-                note + shift if note < threshold else note 
-                for note in adjusted_notes
-            ]
-        elif shift < 0:  # Shift lower
-            adjusted_notes = [
-                note + shift if note > threshold else note 
-                for note in adjusted_notes
-            ]
+            adjusted_notes = [note + shift * (note < threshold) for note in adjusted_notes]
+        else:  # Shift lower
+            adjusted_notes = [note + shift * (note > threshold) for note in adjusted_notes]
     
     return adjusted_notes
 
-def get_default_melody_notes() -> list:
-    """Get default melody pattern (C-D-E-F)."""
-    return DEFAULT_MELODY_NOTES.copy()
+def get_default_melody_notes() -> Tuple[int, ...]:
+    """Get default melody pattern (C-D-E-F) as a shared tuple."""
+    return DEFAULT_MELODY_NOTES
 
-def get_default_rhythm_pattern() -> list:
-    """Get default rhythm pattern (quarter notes).""" 
-    return DEFAULT_RHYTHM_PATTERN.copy()
+def get_default_rhythm_pattern() -> Tuple[float, ...]:
+    """Get default rhythm pattern (quarter notes) as a shared tuple."""
+    return DEFAULT_RHYTHM_PATTERN
 
 def get_section_energy_level(section_type, genre_data: dict) -> float:
     """
@@ -1064,37 +1228,25 @@ def get_section_energy_level(section_type, genre_data: dict) -> float:
         Energy level between 0.0 and 1.0
     """
     # Handle both enum and string types
-    section_str = section_type.value if hasattr(section_type, 'value') else str(section_type).lower()
+    try:
+        modifier = SECTION_ENERGY_MODIFIERS.get(section_type.value, 0.0)
+    except AttributeError:
+        modifier = _get_ci(SECTION_ENERGY_MODIFIERS, str(section_type), 0.0)
     
-    base_energy = genre_data.get("energy_level", 0.5)
-    energy_modifiers = {
-        "intro": -0.2,
-        "verse": -0.1,
-        "chorus": +0.2,
-        "bridge": +0.1,
-        "solo": +0.3,
-        "breakdown": -0.3,
-        "build_up": +0.4,
-        "outro": -0.2,
-    }
-    modifier = energy_modifiers.get(section_str, 0.0)
-    return max(0.0, min(1.0, base_energy + modifier))
+    return max(0.0, min(1.0, genre_data.get("energy_level", 0.5) + modifier))
+
+@functools.lru_cache(maxsize=64)
+def _parse_key(key: str):
+    """Parse a key string such as 'C', 'Am', 'F# minor' or 'Bb major' into a music21 Key."""
+    _load_music21()
+    match = _KEY_RE.match(key)
+    if match is None:
+        return _m21_key.Key(key, 'major')
+    mode = (match.group(2) or match.group(3) or '').lower()
+    return _m21_key.Key(match.group(1), 'minor' if mode in ('minor', 'm') else 'major')
 
 def convert_roman_to_chord_symbol(roman_numeral: str, key: str) -> str:
     """Convert Roman numeral to chord symbol using music21."""
-    from music21 import roman, key as music21_key
-    
-    # Parse the key
-    if 'major' in key.lower():
-        key_obj = music21_key.Key(key.replace(' major', ''), 'major')
-    elif 'minor' in key.lower() or 'm' in key.lower():
-        key_name = key.replace(' minor', '').replace('m', '')
-        key_obj = music21_key.Key(key_name, 'minor')
-    else:
-        # Determine if major or minor by common patterns
-        minor_keys = ['am', 'em', 'bm', 'f#m', 'c#m', 'g#m', 'd#m', 'dm', 'gm', 'cm', 'fm', 'bbm', 'ebm', 'abm', 'dbm', 'gbm']
-        key_obj = music21_key.Key(key.replace('m', ''), 'minor') if key.lower() in minor_keys else music21_key.Key(key, 'major')
-    
-    # Create Roman numeral object and convert to chord
-    roman_obj = roman.RomanNumeral(roman_numeral, key_obj)
-    return roman_obj.figure
\ No newline at end of file
+    _load_music21()
+    roman_obj = _m21_roman.RomanNumeral(roman_numeral, _parse_key(key))
+    return roman_obj.figure
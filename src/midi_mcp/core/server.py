@@ -15,22 +15,20 @@ and async event loop management for MIDI operations.
 #
 
 import asyncio
+import functools
+import json
 import logging
 import sys
-from typing import Any, Dict, List, Optional, Callable, Awaitable
+import time
+from typing import Any, Dict, List, Optional, Callable, Tuple
 from abc import ABC, abstractmethod
 
 from mcp.server.fastmcp import FastMCP
-from mcp.server.models import InitializationOptions
-from mcp.types import Tool, TextContent, ImageContent, EmbeddedResource
+from mcp.types import Tool, TextContent
 
 from ..config.settings import ServerConfig
+from ..constants import RENDERED_HELP, SERVER_STATUS_CACHE_TTL, TOOL_CATEGORIES
 from ..tools.registry import ToolRegistry
-from ..tools.midi_tools import register_midi_tools
-from ..tools.file_tools import register_midi_file_tools
-from ..tools.theory_tools import register_theory_tools
-from ..tools.genre_tools import register_genre_tools
-from ..tools.composition_tools import register_composition_tools
 from ..midi.manager import MidiManager
 from ..midi.file_ops import MidiFileManager
 from ..midi.player import MidiFilePlayer
@@ -38,9 +36,34 @@ from ..midi.analyzer import MidiAnalyzer
 from ..utils.logger import setup_logging
 
 
+# Text responses always carry type="text"; bind it once
+_text = functools.partial(TextContent, type="text")
+
+
+def _render_help(tool_name: Optional[str] = None, category: Optional[str] = None) -> str:
+    """Look up pre-rendered help text for a tool, a category, or the overview."""
+    if tool_name:
+        return RENDERED_HELP.get(("tool", tool_name)) or (
+            f"Tool '{tool_name}' not found. Use 'help()' to see all available tools."
+        )
+    if category:
+        return RENDERED_HELP.get(("category", category)) or (
+            f"Category '{category}' not found. Valid categories: {', '.join(TOOL_CATEGORIES.keys())}"
+        )
+    return RENDERED_HELP[None]
+
+
+@functools.lru_cache(maxsize=256)
+def _help_response(tool_name: Optional[str] = None, category: Optional[str] = None) -> List[TextContent]:
+    """Build the help tool response once per argument pair and hand out the same object afterwards."""
+    return [_text(text=_render_help(tool_name, category))]
+
+
 class MCPServerInterface(ABC):
     """Abstract interface for MCP server implementations."""
 
+    __slots__ = ()
+
     @abstractmethod
     async def start(self) -> None:
         """Start the MCP server."""
@@ -65,6 +88,20 @@ class MCPServer(MCPServerInterface):
     the foundation for MIDI device management and musical operations.
     """
 
+    __slots__ = (
+        "config",
+        "logger",
+        "app",
+        "tool_registry",
+        "file_manager",
+        "midi_manager",
+        "player",
+        "analyzer",
+        "_running",
+        "_status_cache",
+        "_stop_event",
+    )
+
     def __init__(self, config: Optional[ServerConfig] = None) -> None:
         """
         Initialize the MCP server.
@@ -78,15 +115,15 @@ class MCPServer(MCPServerInterface):
         # Initialize FastMCP server
         self.app = FastMCP("MIDI MCP Server")
         self.tool_registry = ToolRegistry()
-        self._running = False
-
-        # Initialize MIDI manager
-        self.midi_manager = MidiManager(self.config.midi_config)
-
-        # Initialize Phase 2 components (file operations, playback, analysis)
+        # Theory and composition tools always write MIDI files, so the file manager is built up front
         self.file_manager = MidiFileManager()
-        self.player = MidiFilePlayer()
-        self.analyzer = MidiAnalyzer()
+        # The MIDI device manager, player and analyzer are only built when the MIDI tools register
+        self.midi_manager: Optional[MidiManager] = None
+        self.player: Optional[MidiFilePlayer] = None
+        self.analyzer: Optional[MidiAnalyzer] = None
+        self._running = False
+        self._status_cache: Tuple[float, Optional[List[TextContent]]] = (0.0, None)
+        self._stop_event: Optional[asyncio.Event] = None
 
         self.logger.info(
             "MIDI MCP Server initialized with Phase 1-5 capabilities (MIDI + Music Theory + Genre Knowledge + Composition)"
@@ -119,30 +156,27 @@ class MCPServer(MCPServerInterface):
         @self.app.tool(name="server_status")
         async def server_status() -> List[TextContent]:
             """Get server status information."""
-            status = {
+            now = time.monotonic()
+            cached_at, cached = self._status_cache
+            if cached is not None and now - cached_at < SERVER_STATUS_CACHE_TTL:
+                return cached
+
+            status: Dict[str, Any] = {
                 "running": self._running,
-                "tools_registered": len(self.tool_registry.tools),
+                "tools_registered": len(self.tool_registry),
                 "config": {"log_level": self.config.log_level, "debug_mode": self.config.debug_mode},
             }
 
             # Add MIDI backend information if MIDI is enabled
-            if self.config.enable_midi and self.midi_manager:
-                backend_status = self.midi_manager.get_backend_status()
-                status["midi_backends"] = backend_status
-
-                # Add connected devices count
-                connected_devices = self.midi_manager.get_connected_devices()
-                status["connected_devices"] = len(connected_devices)
+            if self.midi_manager is not None:
+                status["midi_backends"] = self.midi_manager.get_backend_status()
+                status["connected_devices"] = len(self.midi_manager.get_connected_devices())
+                status["loaded_midi_files"] = len(self.file_manager.list_midi_files())
+                status["active_playbacks"] = len(self.player.list_active_playbacks())
 
-                # Add file manager status
-                midi_files = self.file_manager.list_midi_files()
-                status["loaded_midi_files"] = len(midi_files)
-
-                # Add player status
-                active_playbacks = self.player.list_active_playbacks()
-                status["active_playbacks"] = len(active_playbacks)
-
-            return [TextContent(type="text", text=f"MIDI MCP Server Status:\n{status}")]
+            result = [_text(text=f"MIDI MCP Server Status:\n{json.dumps(status, indent=2)}")]
+            self._status_cache = (now, result)
+            return result
 
         self.tool_registry.register("server_status", status_tool, server_status)
 
@@ -169,76 +203,7 @@ class MCPServer(MCPServerInterface):
         @self.app.tool(name="help")
         async def help_tool_handler(tool_name: str = None, category: str = None) -> List[TextContent]:
             """Get comprehensive help information about available tools."""
-            from ..constants import TOOL_DEFINITIONS, TOOL_CATEGORIES, TOOL_HELP_BY_CATEGORY
-            
-            if tool_name:
-                # Get help for specific tool
-                if tool_name in TOOL_DEFINITIONS:
-                    tool_info = TOOL_DEFINITIONS[tool_name]
-                    help_text = f"# {tool_name}\n\n"
-                    help_text += f"**Category**: {TOOL_CATEGORIES.get(tool_info['category'], 'Unknown')}\n\n"
-                    help_text += f"**Description**: {tool_info['description']}\n\n"
-                    
-                    if tool_info.get('parameters'):
-                        help_text += "**Parameters**:\n"
-                        for param, desc in tool_info['parameters'].items():
-                            help_text += f"- `{param}`: {desc}\n"
-                        help_text += "\n"
-                    
-                    help_text += f"**Returns**: {tool_info['returns']}\n\n"
-                    
-                    if tool_info.get('examples'):
-                        help_text += "**Examples**:\n"
-                        for example in tool_info['examples']:
-                            help_text += f"```\n{example}\n```\n"
-                    
-                    return [TextContent(type="text", text=help_text)]
-                else:
-                    return [TextContent(type="text", text=f"Tool '{tool_name}' not found. Use 'help()' to see all available tools.")]
-            
-            elif category:
-                # Get help for specific category
-                if category in TOOL_HELP_BY_CATEGORY:
-                    help_text = f"# {TOOL_CATEGORIES.get(category, category.title())} Tools\n\n"
-                    
-                    for tool_name, tool_info in TOOL_HELP_BY_CATEGORY[category].items():
-                        help_text += f"## {tool_name}\n"
-                        help_text += f"{tool_info['description']}\n"
-                        
-                        if tool_info.get('parameters'):
-                            param_count = len(tool_info['parameters'])
-                            help_text += f"*{param_count} parameter{'s' if param_count != 1 else ''}*\n"
-                        
-                        help_text += "\n"
-                    
-                    return [TextContent(type="text", text=help_text)]
-                else:
-                    valid_categories = ", ".join(TOOL_CATEGORIES.keys())
-                    return [TextContent(type="text", text=f"Category '{category}' not found. Valid categories: {valid_categories}")]
-            
-            else:
-                # Get overview of all tools
-                help_text = "# MIDI MCP Server - Available Tools\n\n"
-                
-                for cat_key, cat_name in TOOL_CATEGORIES.items():
-                    help_text += f"## {cat_name}\n"
-                    
-                    if cat_key in TOOL_HELP_BY_CATEGORY:
-                        for tool_name, tool_info in TOOL_HELP_BY_CATEGORY[cat_key].items():
-                            help_text += f"- **{tool_name}**: {tool_info['description']}\n"
-                    
-                    help_text += "\n"
-                
-                help_text += "## Usage\n"
-                help_text += "- `help('tool_name')` - Get detailed help for a specific tool\n"
-                help_text += "- `help(category='category_name')` - Get help for tools in a category\n"
-                help_text += "- `help()` - Show this overview\n\n"
-                
-                help_text += "## Available Categories\n"
-                for cat_key, cat_name in TOOL_CATEGORIES.items():
-                    help_text += f"- `{cat_key}`: {cat_name}\n"
-                
-                return [TextContent(type="text", text=help_text)]
+            return _help_response(tool_name, category)
 
         self.tool_registry.register("help", help_tool, help_tool_handler)
         self.logger.debug("Registered default tools")
@@ -246,52 +211,45 @@ class MCPServer(MCPServerInterface):
     def _register_midi_tools(self) -> None:
         """Register MIDI-specific tools."""
         if self.config.enable_midi:
-            try:
-                # Register Phase 1 tools (basic MIDI operations)
-                register_midi_tools(self.app, self.midi_manager, self.tool_registry)
-                self.logger.debug("Registered Phase 1 MIDI tools")
-            except Exception as e:
-                self.logger.error(f"Error registering Phase 1 MIDI tools: {e}")
-
-            try:
-                # Register Phase 2 tools (file operations, playback, analysis)
-                register_midi_file_tools(
-                    self.app, self.tool_registry, self.midi_manager, self.file_manager, self.player, self.analyzer
-                )
-                self.logger.debug("Registered Phase 2 MIDI tools")
-            except Exception as e:
-                self.logger.error(f"Error registering Phase 2 MIDI tools: {e}")
-
+            from ..tools.midi_tools import register_midi_tools
+            from ..tools.file_tools import register_midi_file_tools
+
+            self.midi_manager = MidiManager(self.config.midi_config)
+            self.player = MidiFilePlayer()
+            self.analyzer = MidiAnalyzer()
+            # Register Phase 1 tools (basic MIDI operations)
+            register_midi_tools(self.app, self.midi_manager, self.tool_registry)
+            # Register Phase 2 tools (file operations, playback, analysis)
+            register_midi_file_tools(
+                self.app, self.tool_registry, self.midi_manager, self.file_manager, self.player, self.analyzer
+            )
             self.logger.debug("Registered MIDI tools (Phase 1 & Phase 2)")
         else:
             self.logger.info("MIDI tools disabled in configuration")
 
     def _register_theory_tools(self) -> None:
         """Register music theory tools (Phase 3)."""
-        try:
-            # Register Phase 3 tools (music theory) with file manager for direct MIDI output
-            register_theory_tools(self.app, self.file_manager)
-            self.logger.debug("Registered music theory tools (Phase 3)")
-        except Exception as e:
-            self.logger.error(f"Error registering theory tools: {e}")
+        from ..tools.theory_tools import register_theory_tools
+
+        # Register Phase 3 tools (music theory) with file manager for direct MIDI output
+        register_theory_tools(self.app, self.file_manager)
+        self.logger.debug("Registered music theory tools (Phase 3)")
 
     def _register_genre_tools(self) -> None:
         """Register genre knowledge tools (Phase 4)."""
-        try:
-            # Register Phase 4 tools (genre knowledge and composition)
-            register_genre_tools(self.app)
-            self.logger.debug("Registered genre knowledge tools (Phase 4)")
-        except Exception as e:
-            self.logger.error(f"Error registering genre tools: {e}")
+        from ..tools.genre_tools import register_genre_tools
+
+        # Register Phase 4 tools (genre knowledge and composition)
+        register_genre_tools(self.app)
+        self.logger.debug("Registered genre knowledge tools (Phase 4)")
 
     def _register_composition_tools(self) -> None:
         """Register advanced composition tools (Phase 5)."""
-        try:
-            # Register Phase 5 tools (song structure, melodic development, etc.) with file manager for direct MIDI output
-            register_composition_tools(self.app, self.file_manager)
-            self.logger.debug("Registered composition tools (Phase 5)")
-        except Exception as e:
-            self.logger.error(f"Error registering composition tools: {e}")
+        from ..tools.composition_tools import register_composition_tools
+
+        # Register Phase 5 tools (song structure, melodic development, etc.) with file manager for direct MIDI output
+        register_composition_tools(self.app, self.file_manager)
+        self.logger.debug("Registered composition tools (Phase 5)")
 
     def register_tool(self, tool: Tool, handler: Callable) -> None:
         """
@@ -302,9 +260,8 @@ class MCPServer(MCPServerInterface):
             handler: Async function to handle the tool call
         """
         self.tool_registry.register(tool.name, tool, handler)
-
-        # Register with FastMCP
-        self.app.tool(name=tool.name)(handler)
+        self.app.add_tool(handler, name=tool.name)
+        self._status_cache = (0.0, None)
 
         self.logger.info(f"Registered tool: {tool.name}")
 
@@ -312,18 +269,20 @@ class MCPServer(MCPServerInterface):
         """Start the MCP server."""
         try:
             self._running = True
+            self._status_cache = (0.0, None)
+            # Created here so the event belongs to the loop running the server
+            self._stop_event = asyncio.Event()
             self.logger.info("Starting MIDI MCP Server")
 
             # FastMCP servers run via stdin/stdout, not as async servers
             # For standalone testing, we just mark as running and wait
             self.logger.info("Server ready for MCP connections via stdio")
-            self.logger.info(f"Registered {len(self.tool_registry.tools)} tools")
+            self.logger.info(f"Registered {len(self.tool_registry)} tools")
 
             # In a real MCP environment, the host will connect via stdio
             # For testing, we can just keep the server alive
             try:
-                while self._running:
-                    await asyncio.sleep(1)
+                await self._stop_event.wait()
             except KeyboardInterrupt:
                 self.logger.info("Server shutdown requested")
                 self._running = False
@@ -337,28 +296,31 @@ class MCPServer(MCPServerInterface):
         """Stop the MCP server."""
         self.logger.info("Stopping MIDI MCP Server")
         self._running = False
+        if self._stop_event is not None:
+            self._stop_event.set()
 
         # Clean up any resources
         await self._cleanup()
 
     async def _cleanup(self) -> None:
         """Clean up server resources."""
+        self._status_cache = (0.0, None)
         try:
-            # Stop all MIDI playback
-            if hasattr(self, "player"):
+            # Stop all MIDI playback (only if the player was ever created)
+            if self.player is not None:
                 await self.player.stop_all_playback()
 
-            # Clean up MIDI manager
-            if hasattr(self, "midi_manager"):
+            # Clean up MIDI manager (only if it was ever created)
+            if self.midi_manager is not None:
                 await self.midi_manager.cleanup()
 
             self.logger.debug("Server cleanup completed")
         except Exception as e:
             self.logger.error(f"Error during cleanup: {e}")
 
-    def get_registered_tools(self) -> List[Tool]:
-        """Get list of all registered tools."""
-        return list(self.tool_registry.tools.values())
+    def get_registered_tools(self) -> Tuple[Tool, ...]:
+        """Get an immutable snapshot of all registered tools."""
+        return self.tool_registry.get_tools()
 
     @property
     def is_running(self) -> bool:
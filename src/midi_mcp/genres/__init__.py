@@ -2,21 +2,47 @@
 
 This module provides comprehensive genre-specific musical knowledge through
 generic, parameterized tools that work with any musical genre.
+
+Submodules are imported on first attribute access (PEP 562), so importing
+``GenreManager`` does not also load the fusion engine or validator.
 """
 
-from .genre_manager import GenreManager
-from .composer import Composer
-from .library_integration import LibraryIntegration, get_library_integration
-from .pattern_library import PatternLibrary
-from .fusion_engine import FusionEngine
-from .validator import AuthenticityValidator
-
-__all__ = [
-    "GenreManager",
-    "Composer",
-    "LibraryIntegration",
-    "get_library_integration",
-    "PatternLibrary",
-    "FusionEngine",
-    "AuthenticityValidator",
-]
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from .composer import Composer
+    from .fusion_engine import FusionEngine
+    from .genre_manager import GenreManager
+    from .library_integration import LibraryIntegration, get_library_integration
+    from .pattern_library import PatternLibrary
+    from .validator import AuthenticityValidator
+
+# Public name -> submodule that defines it
+_EXPORTS = {
+    "GenreManager": "genre_manager",
+    "Composer": "composer",
+    "LibraryIntegration": "library_integration",
+    "get_library_integration": "library_integration",
+    "PatternLibrary": "pattern_library",
+    "FusionEngine": "fusion_engine",
+    "AuthenticityValidator": "validator",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    """Import the submodule defining ``name`` on first access and cache the attribute."""
+    try:
+        module_name = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """List the lazily exported names alongside those already loaded."""
+    return sorted(list(globals()) + __all__)
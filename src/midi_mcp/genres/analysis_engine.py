@@ -1,6 +1,7 @@
 """Analyzes musical elements."""
 
 from typing import Dict, List, Any, Optional
+from ..constants import LARGE_LEAP_SEMITONES
 from .library_integration import LibraryIntegration
 
 
@@ -21,12 +22,17 @@ class AnalysisEngine:
             return {}
 
         # Basic analysis
-        notes = [note["note"] for note in melody]
-        chord_tone_ratio = len([n for n in melody if n.get("relation_to_chord") == "chord_tone"]) / len(melody)
+        chord_tone_ratio = sum(n.get("relation_to_chord") == "chord_tone" for n in melody) / len(melody)
+
+        # Range runs from the lowest to the highest pitch; fall back to first/last when notes cannot be parsed
+        music21 = self.libraries.music21
+        pitches = [(music21.note_to_midi(n["note"]), n["note"]) for n in melody]
+        pitches = [pitch for pitch in pitches if pitch[0] is not None]
+        low, high = (min(pitches)[1], max(pitches)[1]) if pitches else (melody[0]["note"], melody[-1]["note"])
 
         return {
-            "note_count": len(notes),
-            "range": f"{notes[0]} to {notes[-1]}",
+            "note_count": len(melody),
+            "range": f"{low} to {high}",
             "chord_tone_ratio": round(chord_tone_ratio, 2),
             "genre_appropriateness": "high" if chord_tone_ratio > 0.6 else "medium",
         }
@@ -36,28 +42,30 @@ class AnalysisEngine:
         if len(bass_line) < 2:
             return {"quality": "insufficient_data"}
 
-        # Check for large leaps using music21
+        # Check for large leaps: parse each note to MIDI once with music21, then subtract integers
         large_leaps = 0
         leap_details = []
+        music21 = self.libraries.music21
+        # Parallel note-name / MIDI lists so the scan below reads list slots instead of dict keys;
+        # without music21 every MIDI slot stays None and no leaps are reported
+        notes = [n.get("note") for n in bass_line]
+        available = music21.is_available()
+        midi = [music21.note_to_midi(note) if note and available else None for note in notes]
 
-        for i in range(1, len(bass_line)):
-            current_note = bass_line[i].get("note")
-            previous_note = bass_line[i - 1].get("note")
-
-            if current_note and previous_note:
-                if self.libraries.music21.is_available():
-                    is_leap = self.libraries.music21.is_large_leap(previous_note, current_note, threshold_semitones=7)
-                    if is_leap:
-                        large_leaps += 1
-                        interval = self.libraries.music21.calculate_interval_semitones(previous_note, current_note)
-                        leap_details.append(
-                            {
-                                "from": previous_note,
-                                "to": current_note,
-                                "interval_semitones": interval,
-                                "beat": bass_line[i].get("beat"),
-                            }
-                        )
+        for i, (previous_midi, current_midi) in enumerate(zip(midi, midi[1:]), 1):
+            if current_midi is not None and previous_midi is not None:
+                # Larger than a perfect fifth counts as a large leap
+                interval = abs(current_midi - previous_midi)
+                if interval > LARGE_LEAP_SEMITONES:
+                    large_leaps += 1
+                    leap_details.append(
+                        {
+                            "from": notes[i - 1],
+                            "to": notes[i],
+                            "interval_semitones": interval,
+                            "beat": bass_line[i].get("beat"),
+                        }
+                    )
 
         quality = "smooth" if large_leaps == 0 else "moderate" if large_leaps <= 2 else "choppy"
         recommendations = []
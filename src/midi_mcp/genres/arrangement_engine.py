@@ -1,6 +1,8 @@
 """Creates full arrangements from musical parts."""
 
+import sys
 from typing import Dict, List, Any
+from ..constants import ARRANGEMENT_SECTION_DYNAMICS, ARRANGEMENT_TEXTURES
 
 
 class ArrangementEngine:
@@ -21,34 +23,17 @@ class ArrangementEngine:
         if instrumentation in ["full", "orchestral"]:
             instruments.extend(inst_data.get("optional", ["guitar"]))
 
-        return list(set(instruments))  # Remove duplicates
+        # Remove duplicates, keeping genre order; names from genre JSON are interned for the part lookup tables
+        return list(dict.fromkeys(map(sys.intern, instruments)))
 
     def determine_texture(self, genre: str, instrumentation: str) -> str:
         """Determine arrangement texture based on genre and instrumentation."""
-        texture_map = {
-            ("blues", "minimal"): "sparse",
-            ("blues", "standard"): "medium",
-            ("rock", "standard"): "dense",
-            ("jazz", "standard"): "complex",
-            ("ambient", "standard"): "layered",
-        }
-
-        return texture_map.get((genre, instrumentation), "medium")
+        return ARRANGEMENT_TEXTURES.get((genre, instrumentation), "medium")
 
     def create_dynamic_plan(self, song_structure: Dict[str, Any], genre: str) -> List[str]:
         """Create dynamic plan for the arrangement."""
         # Simplified dynamic planning
         sections = song_structure.get("sections", ["verse", "chorus", "verse", "chorus"])
-        dynamics = []
-
-        for section in sections:
-            if section == "verse":
-                dynamics.append("mp")  # mezzo-piano
-            elif section == "chorus":
-                dynamics.append("f")  # forte
-            elif section == "bridge":
-                dynamics.append("mf")  # mezzo-forte
-            else:
-                dynamics.append("mp")
-
-        return dynamics
+        # Sections come from user JSON and may be unhashable (e.g. dicts); those play mezzo-piano too
+        dynamics = ARRANGEMENT_SECTION_DYNAMICS
+        return [dynamics.get(section, "mp") if isinstance(section, str) else "mp" for section in sections]
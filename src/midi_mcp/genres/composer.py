@@ -1,5 +1,6 @@
 """Main composition class that orchestrates the composition process."""
 
+import sys
 from typing import Dict, Optional, Any
 
 from .genre_manager import GenreManager
@@ -11,15 +12,16 @@ from .analysis_engine import AnalysisEngine
 class Composer:
     """High-level composition facade."""
 
-    def __init__(self, genre_manager: Optional[GenreManager] = None):
+    def __init__(self, genre_manager: Optional[GenreManager] = None, seed: Optional[int] = None):
         """Initialize the composer.
 
         Args:
             genre_manager: Optional genre manager instance
+            seed: Optional seed so identical requests produce identical melodies
         """
         self.genre_manager = genre_manager or GenreManager()
         self.libraries = self.genre_manager.libraries
-        self.part_generator = PartGenerator(self.libraries)
+        self.part_generator = PartGenerator(self.libraries, seed)
         self.arrangement_engine = ArrangementEngine()
         self.analysis_engine = AnalysisEngine(self.libraries)
 
@@ -27,6 +29,7 @@ class Composer:
         self, genre: str, key: str, variation: str = "standard", bars: Optional[int] = None
     ) -> Dict[str, Any]:
         """Create authentic chord progression for any genre."""
+        genre, variation = sys.intern(genre), sys.intern(variation)
         progression = self.genre_manager.create_progression_from_library(genre, key, variation)
 
         if bars:
@@ -43,16 +46,17 @@ class Composer:
         self, genre: str, key: str, progression: Dict[str, Any], style: str = "typical"
     ) -> Dict[str, Any]:
         """Generate authentic melody for any genre."""
+        genre, style = sys.intern(genre), sys.intern(style)
         genre_data = self.genre_manager.get_genre_data(genre)
         scale_names = genre_data.get("scales", ["major"])
 
+        # get_scale_notes returns None when music21 is unavailable, which falls through to the default scale
         scale_notes = []
-        if self.libraries.music21.is_available():
-            for scale_name in scale_names:
-                notes = self.libraries.music21.get_scale_notes(scale_name, key)
-                if notes:
-                    scale_notes = notes
-                    break
+        for scale_name in scale_names:
+            notes = self.libraries.music21.get_scale_notes(scale_name, key)
+            if notes:
+                scale_notes = notes
+                break
 
         if not scale_notes:
             scale_notes = ["C", "D", "E", "F", "G", "A", "B"]
@@ -73,6 +77,7 @@ class Composer:
         self, genre: str, tempo: int, complexity: str = "medium", variation: str = "standard"
     ) -> Dict[str, Any]:
         """Create authentic drum patterns for any genre."""
+        genre, complexity, variation = sys.intern(genre), sys.intern(complexity), sys.intern(variation)
         genre_data = self.genre_manager.get_genre_data(genre)
         rhythms = genre_data.get("rhythms", {})
 
@@ -98,6 +103,7 @@ class Composer:
 
     def create_bass_line(self, genre: str, progression: Dict[str, Any], style: str = "typical") -> Dict[str, Any]:
         """Generate authentic bass lines for any genre."""
+        genre, style = sys.intern(genre), sys.intern(style)
         if "chords" not in progression:
             return {"error": "Progression must contain chord information"}
 
@@ -120,6 +126,7 @@ class Composer:
         self, genre: str, song_structure: Dict[str, Any], instrumentation: str = "standard"
     ) -> Dict[str, Any]:
         """Create full band arrangement for any genre."""
+        genre, instrumentation = sys.intern(genre), sys.intern(instrumentation)
         genre_data = self.genre_manager.get_genre_data(genre)
         instruments = self.arrangement_engine.select_instruments_for_arrangement(genre_data, instrumentation)
 
@@ -127,13 +134,12 @@ class Composer:
             "genre": genre,
             "instrumentation_level": instrumentation,
             "selected_instruments": instruments,
-            "parts": {},
+            "parts": {
+                instrument: self.part_generator.generate_instrument_part(instrument, song_structure, genre)
+                for instrument in instruments
+            },
             "texture": self.arrangement_engine.determine_texture(genre, instrumentation),
             "dynamics": self.arrangement_engine.create_dynamic_plan(song_structure, genre),
         }
 
-        for instrument in instruments:
-            part = self.part_generator.generate_instrument_part(instrument, song_structure, genre)
-            arrangement["parts"][instrument] = part
-
         return arrangement
@@ -2,8 +2,9 @@
 
 import json
 import os
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from pathlib import Path
+from ..constants import GENRE_DESCRIPTIONS
 from .library_integration import LibraryIntegration
 
 
@@ -24,20 +25,25 @@ class GenreManager:
         self.data_dir = Path(data_dir)
         self._genre_hierarchy = None
         self._genre_data_cache = {}
+        self._comparison_sets: Dict[str, Tuple[frozenset, frozenset]] = {}
+        self._available_genres: Optional[Dict[str, Any]] = None
+        self._related_genres: Dict[str, frozenset] = {}
+        self._genre_parents: Dict[str, Optional[str]] = {}
 
         # Initialize library integration
         self.libraries = LibraryIntegration()
 
-        # Load genre hierarchy
+        # Load genre hierarchy, then all genre data files
         self._load_genre_hierarchy()
+        self._preload_genre_data()
 
     def _load_genre_hierarchy(self) -> None:
         """Load the genre hierarchy from JSON file."""
         hierarchy_file = self.data_dir / "genre_hierarchy.json"
 
         if hierarchy_file.exists():
-            with open(hierarchy_file, "r") as f:
-                self._genre_hierarchy = json.load(f)
+            self._genre_hierarchy = json.loads(hierarchy_file.read_bytes())
+            self._index_genre_relationships()
         else:
             # Create default hierarchy if file doesn't exist
             self._genre_hierarchy = self._create_default_hierarchy()
@@ -100,8 +106,16 @@ class GenreManager:
             }
         }
 
+    def _index_genre_relationships(self) -> None:
+        """Build related-genre sets and the parent map used by _calculate_relationship_score."""
+        genres = self._genre_hierarchy["genres"]
+        self._related_genres = {name: frozenset(info.get("related", ())) for name, info in genres.items()}
+        self._genre_parents = {name: info.get("parent") for name, info in genres.items()}
+
     def _save_genre_hierarchy(self) -> None:
         """Save the genre hierarchy to JSON file."""
+        self._available_genres = None
+        self._index_genre_relationships()
         hierarchy_file = self.data_dir / "genre_hierarchy.json"
         hierarchy_file.parent.mkdir(parents=True, exist_ok=True)
 
@@ -112,8 +126,13 @@ class GenreManager:
         """Get all available genres with categories and descriptions.
 
         Returns:
-            Dictionary of genres with metadata
+            Dictionary of genres with metadata. The listing is cached and shared between calls, so treat it as
+            read-only; copy it before making changes.
         """
+        # The hierarchy is fixed once loaded, so the listing is built once
+        if self._available_genres is not None:
+            return self._available_genres
+
         genres = {}
 
         for genre_name, genre_info in self._genre_hierarchy["genres"].items():
@@ -124,12 +143,13 @@ class GenreManager:
                 "description": self._get_genre_description(genre_name),
             }
 
-        return {
+        self._available_genres = {
             "genres": genres,
             "total_count": len(genres),
             "main_genres": [g for g, info in genres.items() if info["parent"] is None],
             "subgenres": [g for g, info in genres.items() if info["parent"] is not None],
         }
+        return self._available_genres
 
     def get_genre_data(self, genre: str) -> Dict[str, Any]:
         """Get comprehensive data for a specific genre.
@@ -140,25 +160,35 @@ class GenreManager:
         Returns:
             Genre data including characteristics, patterns, and relationships
         """
-        if genre in self._genre_data_cache:
-            return self._genre_data_cache[genre]
+        genre_data = self._genre_data_cache.get(genre)
+        if genre_data is not None:
+            return genre_data
 
-        # Load genre data from file
+        # Load genre data from file (only files added after startup reach this point)
         genre_file = self.data_dir / f"{genre}.json"
 
         if genre_file.exists():
-            with open(genre_file, "r") as f:
-                genre_data = json.load(f)
+            genre_data = json.loads(genre_file.read_bytes())
         else:
             # Create default genre data
             genre_data = self._create_default_genre_data(genre)
             self._save_genre_data(genre, genre_data)
 
-        # Add hierarchy information
+        return self._cache_genre_data(genre, genre_data)
+
+    def _preload_genre_data(self) -> None:
+        """Load every genre file in the data directory once, so lookups never touch the disk."""
+        for genre_file in self.data_dir.glob("*.json"):
+            if genre_file.name != "genre_hierarchy.json":
+                self._cache_genre_data(genre_file.stem, json.loads(genre_file.read_bytes()))
+
+    def _cache_genre_data(self, genre: str, genre_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Merge hierarchy information into genre data and cache the result."""
         if genre in self._genre_hierarchy["genres"]:
             genre_data.update(self._genre_hierarchy["genres"][genre])
 
         self._genre_data_cache[genre] = genre_data
+        self._comparison_sets.pop(genre, None)
         return genre_data
 
     def _create_default_genre_data(self, genre: str) -> Dict[str, Any]:
@@ -184,19 +214,7 @@ class GenreManager:
 
     def _get_genre_description(self, genre: str) -> str:
         """Get a description for a genre."""
-        descriptions = {
-            "blues": "Traditional American blues with 12-bar progressions and blues scales",
-            "rock": "Rock music with electric guitars, strong rhythms, and power chords",
-            "hip_hop": "Urban music with rhythmic speech over strong beats",
-            "jazz": "Sophisticated harmony with improvisation and swing rhythms",
-            "country": "American folk music with storytelling and acoustic instruments",
-            "electronic": "Synthesized music with electronic production techniques",
-            "trance": "Electronic dance music with hypnotic rhythms and build-ups",
-            "pop": "Popular music designed for mass appeal and radio play",
-            "ambient": "Atmospheric music focused on texture and mood",
-            "k_pop": "Korean pop music with polished production and catchy hooks",
-        }
-        return descriptions.get(genre, f"{genre.replace('_', ' ').title()} music")
+        return GENRE_DESCRIPTIONS.get(genre) or f"{genre.replace('_', ' ').title()} music"
 
     def get_progression_patterns(self, genre: str) -> Dict[str, Any]:
         """Get chord progression patterns for a genre."""
@@ -225,6 +243,8 @@ class GenreManager:
         """
         data1 = self.get_genre_data(genre1)
         data2 = self.get_genre_data(genre2)
+        progressions1, instruments1 = self._genre_comparison_sets(genre1)
+        progressions2, instruments2 = self._genre_comparison_sets(genre2)
 
         comparison = {
             "genres": [genre1, genre2],
@@ -234,32 +254,26 @@ class GenreManager:
                 genre1: data1.get("tempo_range", [120, 120]),
                 genre2: data2.get("tempo_range", [120, 120]),
             },
-            "common_progressions": self._find_common_progressions(data1, data2),
-            "instrumentation_overlap": self._find_instrumentation_overlap(data1, data2),
+            "common_progressions": list(progressions1 & progressions2),
+            "instrumentation_overlap": list(instruments1 & instruments2),
             "relationship_score": self._calculate_relationship_score(genre1, genre2),
         }
 
         return comparison
 
-    def _find_common_progressions(self, data1: Dict, data2: Dict) -> List[str]:
-        """Find common chord progressions between two genres."""
-        progs1 = set(data1.get("progressions", {}).keys())
-        progs2 = set(data2.get("progressions", {}).keys())
-        return list(progs1.intersection(progs2))
-
-    def _find_instrumentation_overlap(self, data1: Dict, data2: Dict) -> List[str]:
-        """Find common instruments between two genres."""
-        inst1 = data1.get("instrumentation", {})
-        inst2 = data2.get("instrumentation", {})
-
-        all_inst1 = set()
-        all_inst2 = set()
-
-        for category in ["essential", "typical", "optional"]:
-            all_inst1.update(inst1.get(category, []))
-            all_inst2.update(inst2.get(category, []))
-
-        return list(all_inst1.intersection(all_inst2))
+    def _genre_comparison_sets(self, genre: str) -> Tuple[frozenset, frozenset]:
+        """Progression names and instruments of a genre, built once per cached genre data for compare_genres."""
+        sets = self._comparison_sets.get(genre)
+        if sets is None:
+            data = self.get_genre_data(genre)
+            instrumentation = data.get("instrumentation", {})
+            instruments = frozenset(
+                instrument
+                for category in ("essential", "typical", "optional")
+                for instrument in instrumentation.get(category, [])
+            )
+            sets = self._comparison_sets[genre] = (frozenset(data.get("progressions", {})), instruments)
+        return sets
 
     def _calculate_relationship_score(self, genre1: str, genre2: str) -> float:
         """Calculate how related two genres are (0.0 to 1.0)."""
@@ -267,20 +281,16 @@ class GenreManager:
             return 1.0
 
         # Check direct relationships
-        genre1_info = self._genre_hierarchy["genres"].get(genre1, {})
-        genre2_info = self._genre_hierarchy["genres"].get(genre2, {})
-
-        if genre2 in genre1_info.get("related", []):
-            return 0.8
-        if genre1 in genre2_info.get("related", []):
+        if genre2 in self._related_genres.get(genre1, ()) or genre1 in self._related_genres.get(genre2, ()):
             return 0.8
 
         # Check parent-child relationships
-        if genre1_info.get("parent") == genre2 or genre2_info.get("parent") == genre1:
+        parent1, parent2 = self._genre_parents.get(genre1), self._genre_parents.get(genre2)
+        if parent1 == genre2 or parent2 == genre1:
             return 0.9
 
         # Check sibling relationships (same parent)
-        if genre1_info.get("parent") and genre1_info.get("parent") == genre2_info.get("parent"):
+        if parent1 and parent1 == parent2:
             return 0.7
 
         return 0.1  # Distant relationship
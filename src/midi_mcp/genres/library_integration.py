@@ -1,35 +1,62 @@
 """Integration layer for external music libraries."""
 
 from typing import Dict, List, Optional, Any, Tuple
+import functools
+import importlib
+import importlib.util
 import logging
 from pathlib import Path
 import threading
+from ..constants import (
+    KEY_PROFILE_NAMES,
+    KRUMHANSL_MAJOR_PROFILE,
+    KRUMHANSL_MINOR_PROFILE,
+    LARGE_LEAP_SEMITONES,
+    MUSIC21_SCALE_CLASSES,
+)
 
 # Set up logging
 logging.basicConfig(level=logging.WARNING)
 logger = logging.getLogger(__name__)
 
+# music21 submodules that Music21Integration exposes as lazily imported attributes
+_MUSIC21_SUBMODULES = frozenset({"corpus", "chord", "roman", "key", "scale", "stream", "analysis", "pitch", "note"})
+
+
+@functools.lru_cache(maxsize=None)
+def _key_profile_matrix() -> Any:
+    """24x12 matrix of z-scored key profiles, so a dot product with a chroma vector ranks keys by correlation."""
+    import numpy as np
+
+    profiles = np.array(
+        [np.roll(p, tonic) for p in (KRUMHANSL_MAJOR_PROFILE, KRUMHANSL_MINOR_PROFILE) for tonic in range(12)]
+    )
+    return (profiles - profiles.mean(axis=1, keepdims=True)) / profiles.std(axis=1, keepdims=True)
+
 
 class Music21Integration:
     """Integration wrapper for music21 library."""
 
     def __init__(self):
         """Initialize music21 integration."""
-        try:
-            from music21 import corpus, chord, roman, key, scale, stream, analysis
-
-            self.corpus = corpus
-            self.chord = chord
-            self.roman = roman
-            self.key = key
-            self.scale = scale
-            self.stream = stream
-            self.analysis = analysis
-            self._available = True
+        # Only look music21 up here; importing it costs hundreds of milliseconds, so submodules load on first use
+        self._available = importlib.util.find_spec("music21") is not None
+        if self._available:
             logger.debug("music21 integration initialized")
-        except ImportError as e:
-            logger.warning(f"music21 not available: {e}")
-            self._available = False
+        else:
+            logger.warning("music21 is not installed")
+
+    def __getattr__(self, name: str) -> Any:
+        """Import a music21 submodule (e.g. ``self.chord``) on first access and keep it on the instance.
+
+        Import errors are not caught, so a broken music21 install fails at the call site instead of looking like a
+        missing attribute.
+        """
+        if name not in _MUSIC21_SUBMODULES:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+        module = importlib.import_module(f"music21.{name}")
+        setattr(self, name, module)
+        return module
 
     def is_available(self) -> bool:
         """Check if music21 is available."""
@@ -37,7 +64,8 @@ class Music21Integration:
 
     def get_chord_from_notes(self, notes: List[str]) -> Optional[Dict[str, Any]]:
         """Analyze a chord from note names."""
-        if not self._available:
+        # An empty chord has no root; answer directly rather than letting music21 raise
+        if not self._available or not notes:
             return None
 
         try:
@@ -55,12 +83,17 @@ class Music21Integration:
 
     def get_roman_numeral_chord(self, numeral: str, key_name: str) -> Optional[Dict[str, Any]]:
         """Get chord from Roman numeral in a key."""
+        chord_info = self._roman_numeral_chord(numeral, key_name)
+        return {**chord_info, "notes": list(chord_info["notes"])} if chord_info is not None else None
+
+    @functools.lru_cache(maxsize=1024)
+    def _roman_numeral_chord(self, numeral: str, key_name: str) -> Optional[Dict[str, Any]]:
+        """Resolve a Roman numeral with music21 once per (numeral, key); callers receive copies."""
         if not self._available:
             return None
 
         try:
-            key_obj = self.key.Key(key_name)
-            rn = self.roman.RomanNumeral(numeral, key_obj)
+            rn = self.roman.RomanNumeral(numeral, self._key(key_name))
             return {
                 "numeral": numeral,
                 "key": key_name,
@@ -73,17 +106,19 @@ class Music21Integration:
             logger.warning(f"Error with Roman numeral {numeral} in {key_name}: {e}")
             return None
 
+    @functools.lru_cache(maxsize=64)
+    def _key(self, key_name: str) -> Any:
+        """music21 Key for a key name, shared across numerals; building one takes about a millisecond."""
+        return self.key.Key(key_name)
+
     def analyze_key_from_notes(self, midi_notes: List[int]) -> Optional[Dict[str, Any]]:
         """Analyze key from MIDI note numbers."""
-        if not self._available:
+        if not self._available or not midi_notes:
             return None
 
         try:
-            # Convert MIDI numbers to music21 notes
-            s = self.stream.Stream()
-            for midi_note in midi_notes:
-                note = self.stream.Note(midi=midi_note)
-                s.append(note)
+            # Convert MIDI numbers to music21 notes and build the stream in one call rather than per-note appends
+            s = self.stream.Stream([self.note.Note(midi=midi_note) for midi_note in midi_notes])
 
             analyzed_key = s.analyze("key")
             return {
@@ -98,77 +133,81 @@ class Music21Integration:
 
     def get_scale_notes(self, scale_name: str, key_name: str) -> Optional[List[str]]:
         """Get notes for a scale in a specific key."""
+        notes = self._scale_notes(scale_name.lower(), key_name)
+        return list(notes) if notes is not None else None
+
+    @functools.lru_cache(maxsize=256)
+    def _scale_notes(self, scale_name: str, key_name: str) -> Optional[Tuple[str, ...]]:
+        """Build a scale with music21 once per (scale, key); construction costs milliseconds."""
         if not self._available:
             return None
 
         try:
-            # Handle different scale types
-            if scale_name.lower() == "major":
-                s = self.scale.MajorScale(key_name)
-            elif scale_name.lower() == "minor":
-                s = self.scale.MinorScale(key_name)
-            elif scale_name.lower() == "dorian":
-                s = self.scale.DorianScale(key_name)
-            elif scale_name.lower() == "mixolydian":
-                s = self.scale.MixolydianScale(key_name)
-            else:
-                # Default to major if unknown
-                s = self.scale.MajorScale(key_name)
+            # Default to major if unknown
+            s = getattr(self.scale, MUSIC21_SCALE_CLASSES.get(scale_name, "MajorScale"))(key_name)
 
-            return [str(p) for p in s.pitches]
+            return tuple(str(p) for p in s.pitches)
         except Exception as e:
             logger.warning(f"Error getting {scale_name} scale in {key_name}: {e}")
             return None
 
     def search_corpus_by_genre(self, genre: str) -> List[str]:
         """Search music21 corpus for genre examples."""
+        return list(self._corpus_search(genre))
+
+    @functools.lru_cache(maxsize=64)
+    def _corpus_search(self, genre: str) -> Tuple[str, ...]:
+        """Search the music21 corpus once per genre; each search scans the corpus metadata for about a second."""
         if not self._available:
-            return []
+            return ()
 
         try:
             results = self.corpus.search(genre)
-            return [str(result) for result in results[:10]]  # Limit to 10 results
+            return tuple(str(result) for result in results[:10])  # Limit to 10 results
         except Exception as e:
             logger.warning(f"Error searching corpus for {genre}: {e}")
-            return []
+            return ()
 
-    def calculate_interval_semitones(self, note1: str, note2: str) -> Optional[int]:
-        """Calculate interval between two notes in semitones."""
-        if not self._available:
+    @functools.lru_cache(maxsize=4096)
+    def note_to_midi(self, note_name: str) -> Optional[int]:
+        """Convert a note name (e.g. 'C#4') to its MIDI number (memoized; melodies repeat the same names)."""
+        if not self._available or not note_name:
             return None
 
         try:
-            from music21 import pitch
-
-            p1 = pitch.Pitch(note1)
-            p2 = pitch.Pitch(note2)
-            interval = p2.midi - p1.midi
-            return abs(interval)
+            return self.pitch.Pitch(note_name).midi
         except Exception as e:
-            logger.warning(f"Error calculating interval between {note1} and {note2}: {e}")
+            logger.warning(f"Error converting {note_name} to MIDI: {e}")
+            return None
+
+    def calculate_interval_semitones(self, note1: str, note2: str) -> Optional[int]:
+        """Calculate interval between two notes in semitones."""
+        midi1 = self.note_to_midi(note1)
+        midi2 = self.note_to_midi(note2)
+        if midi1 is None or midi2 is None:
             return None
+        return abs(midi2 - midi1)
 
-    def is_large_leap(self, note1: str, note2: str, threshold_semitones: int = 7) -> bool:
+    def is_large_leap(self, note1: str, note2: str, threshold_semitones: int = LARGE_LEAP_SEMITONES) -> bool:
         """Check if interval between notes is a large leap (default: larger than perfect fifth)."""
         interval = self.calculate_interval_semitones(note1, note2)
         return interval is not None and interval > threshold_semitones
 
+    @functools.lru_cache(maxsize=1024)
     def get_passing_tone(self, from_note: str, to_note: str) -> Optional[str]:
-        """Get a passing tone between two notes."""
+        """Get a passing tone between two notes (memoized; the result is an immutable note name)."""
         if not self._available:
             return None
 
         try:
-            from music21 import pitch
-
-            p1 = pitch.Pitch(from_note)
-            p2 = pitch.Pitch(to_note)
+            p1 = self.pitch.Pitch(from_note)
+            p2 = self.pitch.Pitch(to_note)
 
             # Simple chromatic passing tone
             interval = p2.midi - p1.midi
             if abs(interval) > 2:  # Only if interval is larger than a whole tone
                 passing_midi = p1.midi + (1 if interval > 0 else -1)
-                passing_pitch = pitch.Pitch(midi=passing_midi)
+                passing_pitch = self.pitch.Pitch(midi=passing_midi)
                 return str(passing_pitch)
 
             return None
@@ -204,23 +243,30 @@ class PrettyMidiIntegration:
         try:
             # Create PrettyMIDI object from bytes
             import io
+            import numpy as np
 
             midi = self.pretty_midi.PrettyMIDI(io.BytesIO(midi_data))
 
             analysis = {
                 "duration": midi.get_end_time(),
-                "tempo_changes": len(midi.tempo_changes),
+                "tempo_changes": len(midi.get_tempo_changes()[0]),
                 "time_signature_changes": len(midi.time_signature_changes),
                 "instruments": [],
             }
 
-            # Analyze each instrument
+            # Analyze each instrument, accumulating velocity x duration per pitch class in the same pass over its
+            # notes; this is what get_chroma() sums, without rendering a piano roll for every instrument
+            pitch_class_weights = np.zeros(12)
             for instrument in midi.instruments:
+                notes = np.array([(n.pitch, n.velocity * (n.end - n.start)) for n in instrument.notes]).reshape(-1, 2)
+                pitches = notes[:, 0].astype(int)
+                if len(pitches) and not instrument.is_drum:
+                    pitch_class_weights += np.bincount(pitches % 12, weights=notes[:, 1], minlength=12)
                 inst_analysis = {
                     "program": instrument.program,
                     "is_drum": instrument.is_drum,
-                    "note_count": len(instrument.notes),
-                    "pitch_range": self._get_pitch_range(instrument.notes) if instrument.notes else None,
+                    "note_count": len(pitches),
+                    "pitch_range": (int(pitches.min()), int(pitches.max())) if len(pitches) else None,
                 }
                 analysis["instruments"].append(inst_analysis)
 
@@ -230,14 +276,8 @@ class PrettyMidiIntegration:
             except:
                 analysis["estimated_tempo"] = None
 
-            # Get chroma features
-            try:
-                chroma = midi.get_chroma()
-                analysis["chroma_shape"] = chroma.shape
-                analysis["key_profile"] = self._estimate_key_from_chroma(chroma)
-            except:
-                analysis["chroma_shape"] = None
-                analysis["key_profile"] = None
+            # Pitch-class weights act as a single-frame chroma for the key estimate
+            analysis["key_profile"] = self._estimate_key_from_chroma(pitch_class_weights[:, np.newaxis])
 
             return analysis
 
@@ -245,25 +285,16 @@ class PrettyMidiIntegration:
             logger.warning(f"Error analyzing MIDI file: {e}")
             return None
 
-    def _get_pitch_range(self, notes: List) -> Tuple[int, int]:
-        """Get pitch range from notes."""
-        if not notes:
-            return (0, 0)
-        pitches = [note.pitch for note in notes]
-        return (min(pitches), max(pitches))
-
     def _estimate_key_from_chroma(self, chroma) -> Optional[str]:
-        """Estimate key from chroma features (simplified)."""
+        """Estimate key from chroma features with the Krumhansl-Schmuckler key profiles."""
+        # Silent chroma matches every key equally; report no key instead of the first profile
+        totals = chroma.sum(axis=1)
+        if not totals.any():
+            return None
         try:
-            import numpy as np
-
-            # Sum chroma across time
-            chroma_sum = np.sum(chroma, axis=1)
-            # Find most prominent note
-            dominant_note = np.argmax(chroma_sum)
-            note_names = ["C", "C#", "D", "D#", "E", "F", "F#", "G", "G#", "A", "A#", "B"]
-            return note_names[dominant_note]
-        except:
+            # One matrix product scores all 24 keys against the chroma summed across time
+            return KEY_PROFILE_NAMES[int((_key_profile_matrix() @ totals).argmax())]
+        except (ImportError, ValueError):
             return None
 
 
@@ -387,6 +418,7 @@ class LibraryIntegration:
         return self.music21.search_corpus_by_genre(genre)
 
 
+@functools.lru_cache(maxsize=None)
 def get_library_integration() -> LibraryIntegration:
     """
     Get the singleton instance of LibraryIntegration.
@@ -1,20 +1,30 @@
 """Generates musical parts for different instruments."""
 
 from typing import Dict, List, Any, Optional
+from itertools import cycle, islice
 import random
+from ..constants import (
+    GENRE_ARTICULATIONS,
+    NEXT_NATURAL_NOTE,
+    PART_DEFAULT_PATTERN_TYPES,
+    PART_INSTRUMENT_ROLES,
+    PART_PATTERN_TYPES,
+)
 from .library_integration import LibraryIntegration
 
 
 class PartGenerator:
     """Generates musical parts."""
 
-    def __init__(self, libraries: Optional[LibraryIntegration] = None):
+    def __init__(self, libraries: Optional[LibraryIntegration] = None, seed: Optional[int] = None):
         """Initialize part generator.
 
         Args:
             libraries: Optional library integration instance
+            seed: Optional seed for reproducible melodies
         """
         self.libraries = libraries or LibraryIntegration()
+        self._rng = random.Random(seed)
 
     def generate_melody_from_progression(
         self, progression: Dict[str, Any], scale_notes: List[str], style: str, genre: str
@@ -22,6 +32,9 @@ class PartGenerator:
         """Generate melody notes from chord progression."""
         melody = []
         chords = progression.get("chords", [])
+        # Complex melodies borrow more scale passages than typical ones; the slice is the same for every chord
+        scale_pool = scale_notes[:4] if style == "complex" else scale_notes[:3]
+        choice = self._rng.choice
 
         for i, chord_info in enumerate(chords):
             if isinstance(chord_info, dict) and "notes" in chord_info:
@@ -31,13 +44,9 @@ class PartGenerator:
                 if style == "simple":
                     # Use chord root
                     melody_note = chord_notes[0] if chord_notes else scale_notes[0]
-                elif style == "complex":
-                    # Use chord extensions or scale passages
-                    melody_note = random.choice(chord_notes + scale_notes[:4])
                 else:
-                    # Typical - balance chord tones and passing notes
-                    available_notes = chord_notes + scale_notes[:3]
-                    melody_note = random.choice(available_notes)
+                    # Complex uses chord extensions or scale passages; typical balances chord tones and passing notes
+                    melody_note = choice(chord_notes + scale_pool)
 
                 melody.append(
                     {
@@ -57,24 +66,21 @@ class PartGenerator:
         feel = rhythm_pattern.get("feel", "straight")
         emphasis = rhythm_pattern.get("emphasis", [1, 3])
 
-        # Basic 4/4 pattern
-        pattern = []
-        for beat in range(1, 5):
-            kick = beat in emphasis
-            snare = beat in [2, 4] if complexity != "simple" else beat == 2
-            hihat = True if complexity in ["medium", "complex"] else beat in [1, 3]
-
-            pattern.append(
-                {
-                    "beat": beat,
-                    "kick": kick,
-                    "snare": snare,
-                    "hihat": hihat,
-                    "feel_modifier": "swing" if feel == "swing" else "straight",
-                }
-            )
-
-        return pattern
+        # Basic 4/4 pattern; which beats carry snare and hi-hat depends only on complexity
+        snare_beats = (2, 4) if complexity != "simple" else (2,)
+        hihat_beats = (1, 2, 3, 4) if complexity in ["medium", "complex"] else (1, 3)
+        feel_modifier = "swing" if feel == "swing" else "straight"
+
+        return [
+            {
+                "beat": beat,
+                "kick": beat in emphasis,
+                "snare": beat in snare_beats,
+                "hihat": beat in hihat_beats,
+                "feel_modifier": feel_modifier,
+            }
+            for beat in range(1, 5)
+        ]
 
     def generate_bass_line_from_chords(
         self, chords: List[Dict[str, Any]], style: str, genre: str
@@ -102,12 +108,14 @@ class PartGenerator:
 
     def generate_instrument_part(self, instrument: str, song_structure: Dict[str, Any], genre: str) -> Dict[str, Any]:
         """Generate a part for a specific instrument."""
+        pattern_type = PART_PATTERN_TYPES.get((instrument, genre))
+        pattern_type = pattern_type or PART_DEFAULT_PATTERN_TYPES.get(instrument, "standard")
         return {
             "instrument": instrument,
-            "role": self._determine_instrument_role(instrument, genre),
-            "pattern_type": self._determine_pattern_type(instrument, genre),
+            "role": PART_INSTRUMENT_ROLES.get(instrument, "supporting"),
+            "pattern_type": pattern_type,
             "notes": [],  # Would be filled with actual notes
-            "articulation": self._get_instrument_articulation(instrument, genre),
+            "articulation": GENRE_ARTICULATIONS.get(genre, "normal"),
             "dynamics": "mf",  # Default
         }
 
@@ -118,66 +126,23 @@ class PartGenerator:
             if passing_tone:
                 return passing_tone
 
-        # Fallback to simplified approach
-        note_names = ["C", "D", "E", "F", "G", "A", "B"]
-        if from_note in note_names:
-            idx = note_names.index(from_note)
-            return note_names[(idx + 1) % len(note_names)]
-        return from_note
+        # Fallback to simplified approach: step up to the next natural note
+        return NEXT_NATURAL_NOTE.get(from_note, from_note)
 
     def adjust_progression_length(self, progression: Dict[str, Any], target_bars: int) -> Dict[str, Any]:
         """Adjust progression length to match target bars."""
         current_length = len(progression["pattern"])
 
-        if current_length == target_bars:
+        # An empty pattern has nothing to repeat
+        if current_length == target_bars or current_length == 0:
             return progression
         elif current_length < target_bars:
             # Repeat pattern to fill bars
-            repeats = target_bars // current_length
-            remainder = target_bars % current_length
-            new_pattern = progression["pattern"] * repeats + progression["pattern"][:remainder]
-            progression["pattern"] = new_pattern
-            progression["chords"] = progression["chords"] * repeats + progression["chords"][:remainder]
+            progression["pattern"] = list(islice(cycle(progression["pattern"]), target_bars))
+            progression["chords"] = list(islice(cycle(progression["chords"]), target_bars))
         else:
             # Truncate pattern
             progression["pattern"] = progression["pattern"][:target_bars]
             progression["chords"] = progression["chords"][:target_bars]
 
         return progression
-
-    def _determine_instrument_role(self, instrument: str, genre: str) -> str:
-        """Determine the role of an instrument in a genre."""
-        role_map = {
-            "piano": "harmonic_support",
-            "guitar": "harmonic_lead",
-            "bass": "harmonic_foundation",
-            "drums": "rhythmic_foundation",
-            "vocals": "melodic_lead",
-        }
-        return role_map.get(instrument, "supporting")
-
-    def _determine_pattern_type(self, instrument: str, genre: str) -> str:
-        """Determine playing pattern for instrument in genre."""
-        if instrument == "piano":
-            if genre in ["jazz", "blues"]:
-                return "comping"
-            elif genre in ["rock", "pop"]:
-                return "chordal"
-        elif instrument == "bass":
-            if genre == "jazz":
-                return "walking"
-            else:
-                return "root_based"
-
-        return "standard"
-
-    def _get_instrument_articulation(self, instrument: str, genre: str) -> str:
-        """Get appropriate articulation for instrument in genre."""
-        if genre == "jazz":
-            return "swing"
-        elif genre == "rock":
-            return "staccato"
-        elif genre == "blues":
-            return "legato"
-        else:
-            return "normal"
@@ -140,7 +140,7 @@ def register_midi_tools(app: FastMCP, midi_manager: MidiManager, registry: Optio
             return [TextContent(type="text", text=f"Error disconnecting from device: {str(e)}")]
 
     # Register tools with registry if provided
-    if registry:
+    if registry is not None:
         # Create Tool objects for registry tracking
         discover_tool = Tool(
             name="discover_midi_devices",
@@ -15,7 +15,7 @@ with validation and conflict detection.
 #
 
 import logging
-from typing import Dict, Callable, Optional, List, Any
+from typing import Dict, Callable, Optional, List, Any, Tuple
 from mcp.types import Tool
 
 
@@ -26,6 +26,7 @@ class ToolRegistry:
         """Initialize the tool registry."""
         self.tools: Dict[str, Tool] = {}
         self.handlers: Dict[str, Callable] = {}
+        self._tools_cache: Optional[Tuple[Tool, ...]] = None
         self.logger = logging.getLogger(__name__)
 
     def register(self, name: str, tool: Tool, handler: Callable) -> None:
@@ -51,6 +52,7 @@ class ToolRegistry:
         # Register tool and handler
         self.tools[name] = tool
         self.handlers[name] = handler
+        self._tools_cache = None
 
         self.logger.debug(f"Registered tool: {name}")
 
@@ -64,10 +66,15 @@ class ToolRegistry:
         if name in self.tools:
             del self.tools[name]
             del self.handlers[name]
+            self._tools_cache = None
             self.logger.debug(f"Unregistered tool: {name}")
         else:
             self.logger.warning(f"Attempted to unregister unknown tool: {name}")
 
+    def __len__(self) -> int:
+        """Get the number of registered tools."""
+        return len(self.tools)
+
     def get_tool(self, name: str) -> Optional[Tool]:
         """Get tool definition by name."""
         return self.tools.get(name)
@@ -76,6 +83,12 @@ class ToolRegistry:
         """Get tool handler by name."""
         return self.handlers.get(name)
 
+    def get_tools(self) -> Tuple[Tool, ...]:
+        """Get a snapshot of all registered tool definitions (cached until the registry changes)."""
+        if self._tools_cache is None:
+            self._tools_cache = tuple(self.tools.values())
+        return self._tools_cache
+
     def get_tool_names(self) -> List[str]:
         """Get list of all registered tool names."""
         return list(self.tools.keys())
@@ -134,4 +147,5 @@ class ToolRegistry:
         count = len(self.tools)
         self.tools.clear()
         self.handlers.clear()
+        self._tools_cache = None
         self.logger.info(f"Cleared {count} registered tools")
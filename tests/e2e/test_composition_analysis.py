@@ -154,6 +154,56 @@ class TestCompositionAnalysis:
         passing_tone = self.libraries.music21.get_passing_tone("C4", "E4")
         assert passing_tone in ["C#4", "D4", "D#4"]  # Should be a chromatic passing tone
 
+    def test_music21_key_from_midi_notes(self):
+        """Test key analysis from MIDI note numbers using music21."""
+        if not self.libraries.music21.is_available():
+            pytest.skip("music21 not available")
+
+        key_info = self.libraries.music21.analyze_key_from_notes([60, 62, 64, 65, 67, 69, 71, 72, 67, 64, 60])
+
+        assert key_info["key"] == "C major"
+
+    def test_pretty_midi_key_from_chroma(self):
+        """Test that chroma key estimation distinguishes relative major and minor keys."""
+        if not self.libraries.pretty_midi.is_available():
+            pytest.skip("pretty_midi not available")
+        import numpy as np
+
+        a_minor = np.zeros((12, 1))
+        for pitch_class, weight in [(9, 3), (11, 1), (0, 2), (2, 1), (4, 2), (5, 1), (8, 1)]:
+            a_minor[pitch_class] = weight
+
+        assert self.libraries.pretty_midi._estimate_key_from_chroma(a_minor) == "A minor"
+
+    def test_pretty_midi_analyze_midi_file(self):
+        """Test MIDI file analysis with a pitched track and a drum track."""
+        if not self.libraries.pretty_midi.is_available():
+            pytest.skip("pretty_midi not available")
+        import io
+        import pretty_midi
+
+        midi = pretty_midi.PrettyMIDI(initial_tempo=100)
+        piano = pretty_midi.Instrument(program=0)
+        for i, pitch in enumerate([60, 64, 67, 72, 67, 64, 62, 65, 69, 67, 71, 74, 60, 64, 67, 60]):
+            piano.notes.append(pretty_midi.Note(velocity=90, pitch=pitch, start=i * 0.5, end=i * 0.5 + 0.5))
+        # Hi-hats and crashes on F#, A# and C# would pull the key to F# major if drums counted as pitches
+        drums = pretty_midi.Instrument(program=0, is_drum=True)
+        for i in range(16):
+            drums.notes.append(
+                pretty_midi.Note(velocity=100, pitch=(42, 46, 42, 49)[i % 4], start=i * 0.5, end=i * 0.5 + 0.5)
+            )
+        midi.instruments += [piano, drums]
+        data = io.BytesIO()
+        midi.write(data)
+
+        analysis = self.libraries.pretty_midi.analyze_midi_file(data.getvalue())
+
+        assert analysis["tempo_changes"] == 1
+        assert [inst["note_count"] for inst in analysis["instruments"]] == [16, 16]
+        assert [inst["pitch_range"] for inst in analysis["instruments"]] == [(60, 74), (42, 49)]
+        assert analysis["instruments"][1]["is_drum"]
+        assert analysis["key_profile"] == "C major"
+
     def test_composition_system_integration(self):
         """Test integration of all refactored composition components."""
         # Test that Composer properly initializes with shared libraries
@@ -217,6 +267,22 @@ class TestCompositionAnalysis:
         if melody_result:  # Only check if not empty
             assert "note_count" in melody_result
 
+    def test_melody_range_spans_lowest_to_highest(self):
+        """Test that melody range reports pitch extremes rather than first and last notes."""
+        melody = [{"note": note, "beat": i + 1} for i, note in enumerate(["E4", "C5", "A3", "G4"])]
+
+        characteristics = self.analysis_engine.analyze_melody_characteristics(melody, "test")
+
+        assert characteristics["range"] == "A3 to C5"
+
+    def test_seeded_composers_repeat_melodies(self):
+        """Test that composers with the same seed generate the same melody."""
+        progression = Composer().create_progression("jazz", "C", bars=8)
+
+        melodies = [Composer(seed=42).create_melody("jazz", "C", progression)["melody"] for _ in range(2)]
+
+        assert melodies[0] == melodies[1]
+
 
 if __name__ == "__main__":
     # Run tests directly
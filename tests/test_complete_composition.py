@@ -42,6 +42,35 @@ class TestCompleteComposer:
         assert hasattr(composer, 'ensemble_arranger')
         assert hasattr(composer, 'voice_leading_optimizer')
 
+    def test_mood_register_shift_needs_threshold(self, monkeypatch):
+        """Test that a mood register shift without a threshold leaves notes unchanged."""
+        from midi_mcp import constants
+
+        moods = {"bright": {"register_shift": 12}, "happy": constants.MOOD_ADJUSTMENTS["happy"]}
+        monkeypatch.setattr(constants, "MOOD_ADJUSTMENTS", moods)
+
+        assert constants.apply_mood_adjustments([48, 72], "bright") == [48, 72]
+        assert constants.apply_mood_adjustments([48, 72], "happy") == [60, 72]
+
+    @pytest.mark.parametrize(
+        "key, tonic, mode",
+        [
+            ("C", "C", "major"),
+            ("Am", "A", "minor"),
+            ("F# minor", "F#", "minor"),
+            ("Bb major", "B-", "major"),
+            ("C#m", "C#", "minor"),
+            ("eb minor", "E-", "minor"),
+        ],
+    )
+    def test_parse_key(self, key, tonic, mode):
+        """Test that key strings parse to the expected music21 tonic and mode."""
+        from midi_mcp.constants import _parse_key
+
+        parsed = _parse_key(key)
+
+        assert (parsed.tonic.name, parsed.mode) == (tonic, mode)
+
 
 @pytest.mark.skip(reason="Composition analyzer has import issues - modules not properly structured")
 class TestCompositionAnalyzer:
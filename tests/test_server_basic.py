@@ -18,6 +18,8 @@ import pytest
 import asyncio
 from unittest.mock import patch
 
+from mcp.types import Tool
+
 from midi_mcp.core.server import MCPServer, create_server
 from midi_mcp.config.settings import ServerConfig, MidiConfig
 
@@ -62,6 +64,49 @@ class TestServerBasic:
             assert "connect_midi_device" in tool_names
             assert "play_midi_note" in tool_names
 
+    def test_registered_tools_cache_invalidated_on_register(self):
+        """Test that the cached tool list refreshes when a tool is registered or unregistered."""
+        server = MCPServer()
+        tools = server.get_registered_tools()
+        assert server.get_registered_tools() is tools
+        assert isinstance(tools, tuple)
+
+        async def handler():
+            return []
+
+        probe = Tool(name="cache_probe", description="Probe tool", inputSchema={"type": "object"})
+        server.register_tool(probe, handler)
+        refreshed = server.get_registered_tools()
+        assert refreshed is not tools
+        assert isinstance(refreshed, tuple)
+        assert "cache_probe" in [tool.name for tool in refreshed]
+
+        server.tool_registry.unregister("server_status")
+        assert "server_status" not in [tool.name for tool in server.get_registered_tools()]
+
+    def test_midi_managers_not_created_when_midi_disabled(self):
+        """Test that construction skips the MIDI-only managers when MIDI is disabled."""
+        config = ServerConfig()
+        config.enable_midi = False
+        server = MCPServer(config)
+
+        assert server.file_manager is not None
+        assert server.midi_manager is None
+        assert server.player is None
+        assert server.analyzer is None
+
+    @pytest.mark.asyncio
+    async def test_stop_does_not_create_unused_managers(self):
+        """Test that cleanup skips MIDI subsystems that were never created."""
+        config = ServerConfig()
+        config.enable_midi = False
+        server = MCPServer(config)
+
+        await server.stop()
+
+        assert server.player is None
+        assert server.midi_manager is None
+
     @pytest.mark.asyncio
     async def test_create_server_factory(self):
         """Test server factory function."""